@@ -0,0 +1,19 @@
+"""Batched reads of many small source files."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def read_file(path):
+    """Read a whole file; Path.read_bytes() sizes the read from fstat() and loops to EOF."""
+    return Path(path).read_bytes()
+
+
+def read_files(paths, max_workers=None):
+    """Read every path concurrently and return their contents in order."""
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [read_file(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+        return list(pool.map(read_file, paths))
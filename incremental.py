@@ -0,0 +1,101 @@
+"""Incremental re-parsing of Java files from unified diff hunks."""
+
+import re
+from collections import OrderedDict, namedtuple
+
+from line_map import find_line_starts
+from parsers import get_cached_parser
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@", re.MULTILINE)
+
+Hunk = namedtuple("Hunk", "old_start old_count new_start new_count")
+
+
+def parse_hunks(diff_text):
+    """Return the Hunk ranges from the @@ headers of a single-file diff."""
+    return [
+        Hunk(int(a), int(b or 1), int(c), int(d or 1))
+        for a, b, c, d in HUNK_HEADER.findall(diff_text)
+    ]
+
+
+def line_offsets(source):
+    """Return the byte offset of every line start, plus len(source)."""
+    offsets = find_line_starts(source)
+    if offsets[-1] != len(source):
+        offsets.append(len(source))
+    return offsets
+
+
+def _offset(offsets, row):
+    return offsets[min(row, len(offsets) - 1)]
+
+
+def edits_from_hunks(old_source, new_source, hunks):
+    """Convert diff hunks into tree.edit() keyword arguments.
+
+    Hunks are applied in order, so each edit is expressed in coordinates
+    of the new file: everything before a hunk already matches new_source.
+    """
+    old_lines = line_offsets(old_source)
+    new_lines = line_offsets(new_source)
+    edits = []
+    for hunk in hunks:
+        # A zero-length side points at the line *before* the change.
+        old_row = hunk.old_start if hunk.old_count == 0 else hunk.old_start - 1
+        new_row = hunk.new_start if hunk.new_count == 0 else hunk.new_start - 1
+
+        old_length = (_offset(old_lines, old_row + hunk.old_count)
+                      - _offset(old_lines, old_row))
+        start_byte = _offset(new_lines, new_row)
+        edits.append({
+            "start_byte": start_byte,
+            "old_end_byte": start_byte + old_length,
+            "new_end_byte": _offset(new_lines, new_row + hunk.new_count),
+            "start_point": (new_row, 0),
+            "old_end_point": (new_row + hunk.old_count, 0),
+            "new_end_point": (new_row + hunk.new_count, 0),
+        })
+    return edits
+
+
+def parse_incremental(tree, new_source, edits, lang='java'):
+    """Apply edits to tree and re-parse new_source reusing unchanged nodes."""
+    for edit in edits:
+        tree.edit(**edit)
+    return get_cached_parser(lang).parse(new_source, tree)
+
+
+class TreeCache:
+    """LRU cache of {file_path: (source, Tree)} for repeated PR analysis."""
+
+    def __init__(self, maxsize=512, lang='java'):
+        self.maxsize = maxsize
+        self.lang = lang
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path):
+        """Return the cached Tree for path, or None."""
+        entry = self._entries.get(path)
+        if entry is None:
+            return None
+        self._entries.move_to_end(path)
+        return entry[1]
+
+    def parse(self, path, new_source, diff_text=None):
+        """Parse new_source for path, incrementally when a diff is available."""
+        entry = self._entries.pop(path, None)
+        if entry is not None and diff_text is not None:
+            old_source, old_tree = entry
+            edits = edits_from_hunks(old_source, new_source, parse_hunks(diff_text))
+            tree = parse_incremental(old_tree, new_source, edits, self.lang)
+        else:
+            tree = get_cached_parser(self.lang).parse(new_source)
+
+        self._entries[path] = (new_source, tree)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return tree
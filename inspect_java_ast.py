@@ -1,7 +1,12 @@
 #!/usr/bin/env python3
 """Inspect Java AST structure to find correct node types."""
 
-from tree_sitter_language_pack import get_language, get_parser
+import sys
+from itertools import islice
+
+from parsers import get_cached_parser
+from queries import get_query, summarize_captures
+from source_text import SourceText
 
 # Sample Java file
 JAVA_SAMPLE = """
@@ -19,36 +24,37 @@ public class TestController {
     }
 }
 """
+JAVA_SAMPLE_BYTES = JAVA_SAMPLE.encode('utf-8')
 
 
-def print_ast(node, source, depth=0, max_depth=8):
-    """Recursively print AST structure."""
-    if depth > max_depth:
-        return
-
-    indent = "  " * depth
-    node_text = source[node.start_byte:node.end_byte].decode('utf-8')
-    # Only show first 50 chars
-    node_text = node_text.replace('\n', '\\n')[:50]
+def print_ast(node, text, max_depth=8):
+    """Print AST structure from a decoded SourceText, depth-first without recursion."""
+    out = []
+    stack = [(node, 0)]
+    while stack:
+        node, depth = stack.pop()
+        # Only show first 50 chars
+        node_text = text.node_text(node, 50).replace('\n', '\\n')[:50]
+        out.append(f"{'  ' * depth}{node.type} [{node.start_point[0]}:{node.start_point[1]}] {node_text!r}")
 
-    print(f"{indent}{node.type} [{node.start_point[0]}:{node.start_point[1]}] {node_text!r}")
+        if depth < max_depth:
+            stack.extend((child, depth + 1) for child in reversed(node.children))
 
-    for child in node.children:
-        print_ast(child, source, depth + 1, max_depth)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def main():
-    language = get_language('java')
-    parser = get_parser('java')
+    parser = get_cached_parser('java')
 
     # Parse sample
-    source = JAVA_SAMPLE.encode('utf-8')
+    source = JAVA_SAMPLE_BYTES
     tree = parser.parse(source)
+    text = SourceText(source)
 
     print("=" * 80)
     print("Java AST Structure")
     print("=" * 80)
-    print_ast(tree.root_node, source)
+    print_ast(tree.root_node, text)
 
     print("\n" + "=" * 80)
     print("Looking for specific patterns:")
@@ -65,21 +71,20 @@ def main():
     for name, query_str in queries.items():
         print(f"\n{name}:")
         try:
-            query = language.query(query_str)
-            captures = query.captures(tree.root_node)
-            print(f"  ✅ Query parsed, captures type: {type(captures)}")
-
-            # Handle dict format: {capture_name: [nodes]}
-            if isinstance(captures, dict):
-                total = sum(len(nodes) for nodes in captures.values())
-                print(f"  ✅ Found {total} total captures across {len(captures)} capture names")
-                for capture_name, nodes in list(captures.items())[:2]:  # First 2 capture types
-                    print(f"    Capture '{capture_name}': {len(nodes)} nodes")
-                    for node in nodes[:1]:  # First node of each type
-                        text = source[node.start_byte:node.end_byte].decode('utf-8').replace('\n', ' ')[:60]
-                        print(f"      - {text}")
-            else:
-                print(f"  ℹ️ Unexpected captures format: {type(captures)}")
+            query = get_query('java', query_str)
+            summary = summarize_captures(query, tree.root_node, limit=1)
+            print("  ✅ Query parsed")
+            if not summary:
+                print("  ∅ no matches")
+                continue
+
+            total = sum(count for count, _ in summary.values())
+            print(f"  ✅ Found {total} total captures across {len(summary)} capture names")
+            for capture_name, (count, nodes) in islice(summary.items(), 2):  # First 2 capture types
+                print(f"    Capture '{capture_name}': {count} nodes")
+                for node in nodes:  # First node of each type
+                    snippet = text.node_text(node, 60).replace('\n', ' ')
+                    print(f"      - {snippet}")
 
         except Exception as e:
             print(f"  ❌ {type(e).__name__}: {e}")
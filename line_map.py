@@ -0,0 +1,62 @@
+"""Byte offset -> (row, column) lookup for bulk capture reporting.
+
+When numba is installed the line-start scan is JIT-compiled and lookups
+are vectorized with numpy; otherwise the same results come from a
+bytes.find() scan and bisect. Columns are byte columns, matching
+tree-sitter's start_point. Interactive AST dumps keep reading
+node.start_point directly.
+"""
+
+from bisect import bisect_right
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+
+
+if np is not None:
+    @njit(cache=True)
+    def _line_starts(buf):
+        count = 1
+        for byte in buf:
+            if byte == 10:
+                count += 1
+
+        starts = np.empty(count, dtype=np.int64)
+        starts[0] = 0
+        line = 1
+        for pos in range(buf.shape[0]):
+            if buf[pos] == 10:
+                starts[line] = pos + 1
+                line += 1
+        return starts
+
+
+def find_line_starts(source):
+    """Return a list of the byte offsets at which each line of source starts."""
+    starts = [0]
+    index = source.find(b"\n")
+    while index != -1:
+        starts.append(index + 1)
+        index = source.find(b"\n", index + 1)
+    return starts
+
+
+def compute_line_map(source):
+    """Return the byte offset at which each line of source starts."""
+    if np is not None:
+        return _line_starts(np.frombuffer(source, dtype=np.uint8))
+    return find_line_starts(source)
+
+
+def byte_points(line_starts, byte_offsets):
+    """Return (rows, columns) for byte_offsets using a compute_line_map() result."""
+    if np is not None:
+        offsets = np.asarray(byte_offsets, dtype=np.int64)
+        rows = np.searchsorted(line_starts, offsets, side='right') - 1
+        return rows, offsets - line_starts[rows]
+
+    rows = [bisect_right(line_starts, offset) - 1 for offset in byte_offsets]
+    return rows, [offset - line_starts[row] for offset, row in zip(byte_offsets, rows)]
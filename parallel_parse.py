@@ -0,0 +1,48 @@
+"""Parse many Java files in parallel across worker processes.
+
+Tree-sitter Parser, Query and Tree objects cannot be pickled, so each
+worker builds its own through the lru_cache helpers in parsers/queries,
+and results come back as plain (capture_name, start_byte, end_byte)
+tuples instead of Trees.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from batch_reader import read_file
+from parsers import get_cached_parser
+from queries import get_query
+
+# Files handed to a worker per task, to amortize IPC and process startup.
+BATCH_SIZE = 50
+
+
+def _parse_file(path, query_str, lang):
+    """Parse one file in the worker and return its captures as byte offsets."""
+    tree = get_cached_parser(lang).parse(read_file(path))
+    query = get_query(lang, query_str)
+    captures = []
+    for _, match in query.matches(tree.root_node):
+        for capture_name, nodes in match.items():
+            captures.extend((capture_name, node.start_byte, node.end_byte) for node in nodes)
+    return path, captures
+
+
+def _parse_batch(paths, query_str, lang):
+    return [_parse_file(path, query_str, lang) for path in paths]
+
+
+def parse_files_parallel(paths, query_str, lang='java', max_workers=None):
+    """Return [(path, [(capture_name, start_byte, end_byte), ...])] for paths."""
+    paths = list(paths)
+    batches = [paths[i:i + BATCH_SIZE] for i in range(0, len(paths), BATCH_SIZE)]
+    if len(batches) <= 1:
+        return _parse_batch(paths, query_str, lang)
+
+    workers = min(max_workers or os.cpu_count() or 1, len(batches))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_parse_batch, batch, query_str, lang) for batch in batches]
+        for future in futures:
+            results.extend(future.result())
+    return results
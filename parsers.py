@@ -0,0 +1,22 @@
+"""Process-wide tree-sitter Language and Parser instances.
+
+The returned Parser is shared by every caller in the process. Tree-sitter
+parsers are not safe for concurrent parse() calls, so threads that parse
+in parallel must each build their own parser instead of reusing this one.
+"""
+
+from functools import lru_cache
+
+from tree_sitter_language_pack import get_language, get_parser
+
+
+@lru_cache(maxsize=None)
+def get_cached_language(lang):
+    """Load the grammar for lang once and return the cached Language."""
+    return get_language(lang)
+
+
+@lru_cache(maxsize=None)
+def get_cached_parser(lang):
+    """Create the parser for lang once and return the cached Parser."""
+    return get_parser(lang)
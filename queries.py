@@ -0,0 +1,29 @@
+"""Compiled tree-sitter query cache shared by the Java query scripts."""
+
+from functools import lru_cache
+from itertools import islice
+
+from parsers import get_cached_language
+
+
+@lru_cache(maxsize=None)
+def get_query(lang, query_str):
+    """Compile query_str for lang once and return the cached Query."""
+    return get_cached_language(lang).query(query_str)
+
+
+def summarize_captures(query, node, limit=2):
+    """Stream query.matches() once, returning {capture_name: [count, first_nodes]}.
+
+    Only the first `limit` nodes of each capture name are kept, so callers
+    that display counts plus a short preview never build full capture lists.
+    """
+    summary = {}
+    for _, match in query.matches(node):
+        for capture_name, nodes in match.items():
+            entry = summary.setdefault(capture_name, [0, []])
+            entry[0] += len(nodes)
+            room = limit - len(entry[1])
+            if room > 0:
+                entry[1].extend(islice(nodes, room))
+    return summary
@@ -5,9 +5,60 @@ This will trigger the PR analysis workflow and output results to output/pr-{NUMB
 """
 
 import asyncio
+import logging
+import os
+import sys
 from pathlib import Path
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, TextBlock
 
+logger = logging.getLogger(__name__)
+
+# Flush buffered response text once this many chunks accumulate
+STREAM_FLUSH_CHUNKS = 16
+
+
+def write_chunks(fd, chunks):
+    """
+    Write every chunk to fd, batched into a single writev() syscall where supported
+
+    Args:
+        fd: File descriptor opened for writing
+        chunks: List of bytes to write in order
+    """
+    written = os.writev(fd, chunks) if hasattr(os, "writev") else 0
+    if written == sum(map(len, chunks)):
+        return
+
+    # Platforms without writev (Windows) and short writes finish with write()
+    remaining = memoryview(b"".join(chunks))[written:]
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+
+async def flush_stream(chunks, log_fd, pending_write):
+    """
+    Write buffered text to stdout and hand it to a background log write
+
+    Args:
+        chunks: List of text chunks not yet displayed (cleared on flush)
+        log_fd: File descriptor of the stream log
+        pending_write: Previous log write task, awaited to keep writes ordered
+
+    Returns:
+        The task writing these chunks to the log (or pending_write if there were none)
+    """
+    if not chunks:
+        return pending_write
+
+    sys.stdout.write("".join(chunks))
+    sys.stdout.flush()
+    data = [chunk.encode("utf-8") for chunk in chunks]
+    chunks.clear()
+
+    if pending_write is not None:
+        await pending_write
+    return asyncio.create_task(asyncio.to_thread(write_chunks, log_fd, data))
+
 
 async def run_analyze_pr(repo: str, pr_number: int):
     """
@@ -21,6 +72,9 @@ async def run_analyze_pr(repo: str, pr_number: int):
     print(f"Output will be written to: output/pr-{pr_number}/\n")
     print("=" * 70)
 
+    output_dir = Path("output") / f"pr-{pr_number}"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
     # Configure SDK with working directory and project settings
     options = ClaudeAgentOptions(
         cwd=Path.cwd(),              # Current working directory
@@ -34,13 +88,30 @@ async def run_analyze_pr(repo: str, pr_number: int):
 
         await client.query(command)
 
-        # Stream and display all response messages
-        async for message in client.receive_response():
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print(block.text)
-                        print()  # Extra newline for readability
+        # Stream and display all response messages, mirroring them to stream.log
+        chunks = []
+        pending_write = None
+        # O_BINARY keeps Windows from translating \n to \r\n in the log
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND | getattr(os, "O_BINARY", 0)
+        log_fd = os.open(output_dir / "stream.log", flags, 0o644)
+        try:
+            async for message in client.receive_response():
+                if isinstance(message, AssistantMessage):
+                    for block in message.content:
+                        if isinstance(block, TextBlock):
+                            chunks.append(block.text)
+                            chunks.append("\n\n")  # Extra newline for readability
+                            if len(chunks) >= STREAM_FLUSH_CHUNKS:
+                                pending_write = await flush_stream(chunks, log_fd, pending_write)
+                    # Flush on every message boundary
+                    pending_write = await flush_stream(chunks, log_fd, pending_write)
+        finally:
+            try:
+                # Let the last log write land before the file is closed
+                if pending_write is not None:
+                    await pending_write
+            finally:
+                os.close(log_fd)
 
     print("=" * 70)
     print(f"\n[COMPLETE] Analysis finished!")
@@ -48,6 +119,7 @@ async def run_analyze_pr(repo: str, pr_number: int):
     print(f"  - risk-analysis.json")
     print(f"  - final-report.md")
     print(f"  - metadata.json")
+    print(f"  - stream.log")
 
 
 async def main():
@@ -56,11 +128,15 @@ async def main():
         # Run the PR analysis
         await run_analyze_pr("spring-petclinic-microservices", 494)
 
-    except Exception as e:
-        print(f"\n[ERROR] {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("analyze-pr failed")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO)
+    try:
+        import uvloop  # Optional faster event loop; not available on Windows
+    except ImportError:
+        uvloop = None
+    # Run outside the except block so logged tracebacks don't chain the ImportError
+    (uvloop.run if uvloop else asyncio.run)(main())
@@ -0,0 +1,53 @@
+"""Decode a source buffer once and slice it by tree-sitter byte offsets."""
+
+from itertools import accumulate
+from operator import attrgetter
+
+_START_BYTE = attrgetter('start_byte')
+_END_BYTE = attrgetter('end_byte')
+
+
+class SourceText:
+    """Decoded view of a UTF-8 source buffer addressed by byte offsets."""
+
+    def __init__(self, source):
+        self.source = source
+        self.text = source.decode('utf-8')
+        if source.isascii():
+            # Byte offsets are character offsets; slice the str directly.
+            self._char_offsets = None
+        else:
+            # Count the bytes that start a character (anything that is not
+            # a 10xxxxxx continuation byte) up to every byte offset.
+            self._char_offsets = [0, *accumulate((b & 0xC0) != 0x80 for b in source)]
+
+    def slice(self, start_byte, end_byte, limit=None):
+        """Return the text between two byte offsets, at most `limit` characters."""
+        if self._char_offsets is None:
+            start, end = start_byte, end_byte
+        else:
+            start, end = self._char_offsets[start_byte], self._char_offsets[end_byte]
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.text[start:end]
+
+    def node_text(self, node, limit=None):
+        """Return the text spanned by a tree-sitter node, at most `limit` characters."""
+        return self.slice(node.start_byte, node.end_byte, limit)
+
+    def slices(self, starts, ends):
+        """Return the text for each (start_byte, end_byte) pair, in order.
+
+        The loop runs inside map() rather than the interpreter, which pays
+        off when reporting thousands of captures, e.g. the byte offsets
+        returned by parallel_parse.
+        """
+        if self._char_offsets is not None:
+            starts = map(self._char_offsets.__getitem__, starts)
+            ends = map(self._char_offsets.__getitem__, ends)
+        return list(map(self.text.__getitem__, map(slice, starts, ends)))
+
+    def node_texts(self, nodes):
+        """Return the text of every node in nodes."""
+        nodes = list(nodes)
+        return self.slices(map(_START_BYTE, nodes), map(_END_BYTE, nodes))
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Test fixed Java query templates."""
 
-from tree_sitter_language_pack import get_language, get_parser
+from parsers import get_cached_parser
+from queries import get_query, summarize_captures
+from source_text import SourceText
 
 # Sample Java with more test cases
 JAVA_SAMPLE = """
@@ -27,6 +29,7 @@ public interface TestInterface {
     void method();
 }
 """
+JAVA_SAMPLE_BYTES = JAVA_SAMPLE.encode('utf-8')
 
 # ORIGINAL (BROKEN) templates from java.py
 ORIGINAL_TEMPLATES = {
@@ -71,23 +74,18 @@ FIXED_TEMPLATES = {
         (import_declaration) @import
     """,
     "annotations": """
-        (marker_annotation
-            name: (identifier) @annotation.name) @annotation
-
-        (annotation
-            name: (identifier) @annotation.name) @annotation
+        [
+            (marker_annotation
+                name: (identifier) @annotation.name)
+            (annotation
+                name: (identifier) @annotation.name)
+        ] @annotation
     """,
 }
 
 
-def test_templates(templates, label):
-    """Test a set of templates."""
-    language = get_language('java')
-    parser = get_parser('java')
-
-    source = JAVA_SAMPLE.encode('utf-8')
-    tree = parser.parse(source)
-
+def test_templates(templates, label, tree, text):
+    """Test a set of templates against an already-parsed tree and its SourceText."""
     print("=" * 80)
     print(f"{label}")
     print("=" * 80)
@@ -95,32 +93,36 @@ def test_templates(templates, label):
     for name, query_str in templates.items():
         print(f"\n📋 {name}:")
         try:
-            query = language.query(query_str)
-            captures = query.captures(tree.root_node)
-
-            if isinstance(captures, dict):
-                total = sum(len(nodes) for nodes in captures.values())
-                print(f"  ✅ SUCCESS - {total} total captures")
-
-                for capture_name, nodes in captures.items():
-                    print(f"    '{capture_name}': {len(nodes)} nodes")
-                    for node in nodes[:2]:  # First 2
-                        text = source[node.start_byte:node.end_byte].decode('utf-8')
-                        # Clean up text for display
-                        text = text.split('\n')[0][:60]
-                        print(f"      - {text}")
-            else:
-                print(f"  ℹ️ Captures: {type(captures)}")
+            query = get_query('java', query_str)
+            summary = summarize_captures(query, tree.root_node, limit=2)
+            if not summary:
+                print("  ∅ no matches")
+                continue
+
+            total = sum(count for count, _ in summary.values())
+            print(f"  ✅ SUCCESS - {total} total captures")
+
+            for capture_name, (count, nodes) in summary.items():
+                print(f"    '{capture_name}': {count} nodes")
+                for node in nodes:  # First 2
+                    # Clean up text for display
+                    snippet = text.node_text(node, 60).split('\n')[0]
+                    print(f"      - {snippet}")
 
         except Exception as e:
             print(f"  ❌ FAILED - {type(e).__name__}: {e}")
 
 
 def main():
+    # Both template sets run against the same parse of the sample
+    source = JAVA_SAMPLE_BYTES
+    tree = get_cached_parser('java').parse(source)
+    text = SourceText(source)
+
     print("\n\n")
-    test_templates(ORIGINAL_TEMPLATES, "ORIGINAL (BROKEN) TEMPLATES")
+    test_templates(ORIGINAL_TEMPLATES, "ORIGINAL (BROKEN) TEMPLATES", tree, text)
     print("\n\n")
-    test_templates(FIXED_TEMPLATES, "FIXED TEMPLATES")
+    test_templates(FIXED_TEMPLATES, "FIXED TEMPLATES", tree, text)
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 import sys
 import subprocess
 import json
+from itertools import islice
 
 # Sample Java file for testing
 JAVA_SAMPLE = """
@@ -21,6 +22,7 @@ public class TestController {
     }
 }
 """
+JAVA_SAMPLE_BYTES = JAVA_SAMPLE.encode('utf-8')
 
 # Java query templates from java.py
 TEMPLATES = {
@@ -70,8 +72,8 @@ TEMPLATES = {
 
 def write_sample_file(path="/tmp/TestController.java"):
     """Write sample Java file."""
-    with open(path, 'w') as f:
-        f.write(JAVA_SAMPLE)
+    with open(path, 'wb') as f:
+        f.write(JAVA_SAMPLE_BYTES)
     return path
 
 
@@ -82,21 +84,23 @@ def test_query_via_mcp(project_name, file_path, query_name, query_string):
     pass
 
 
-def test_with_tree_sitter():
+def test_with_tree_sitter(write_sample=False):
     """Test queries directly with tree-sitter Python."""
-    try:
-        from tree_sitter_language_pack import get_language, get_parser
+    if write_sample:
+        print(f"Wrote sample file: {write_sample_file()}")
 
-        # Get Java language and parser
-        language = get_language('java')
-        parser = get_parser('java')
+    try:
+        from parsers import get_cached_parser
+        from queries import get_query, summarize_captures
+        from source_text import SourceText
 
-        # Write and parse sample file
-        file_path = write_sample_file()
-        with open(file_path, 'rb') as f:
-            source = f.read()
+        # Get the shared Java parser
+        parser = get_cached_parser('java')
 
+        # Parse the in-memory sample
+        source = JAVA_SAMPLE_BYTES
         tree = parser.parse(source)
+        text = SourceText(source)
 
         print("=" * 80)
         print("Testing Java Query Templates")
@@ -108,14 +112,15 @@ def test_with_tree_sitter():
             print(f"Query:\n{query_str}")
 
             try:
-                query = language.query(query_str)
-                captures = query.captures(tree.root_node)
-                print(f"✅ SUCCESS - Found {len(captures)} captures")
+                query = get_query('java', query_str)
+                summary = summarize_captures(query, tree.root_node, limit=3)
+                total = sum(count for count, _ in summary.values())
+                print(f"✅ SUCCESS - Found {total} captures")
 
                 # Show first few captures
-                for i, (node, capture_name) in enumerate(captures[:3]):
-                    text = source[node.start_byte:node.end_byte].decode('utf-8')
-                    print(f"  - {capture_name}: {text[:50]}...")
+                first = ((capture_name, node) for capture_name, (_, nodes) in summary.items() for node in nodes)
+                for capture_name, node in islice(first, 3):
+                    print(f"  - {capture_name}: {text.node_text(node, 50)}...")
 
             except Exception as e:
                 print(f"❌ FAILED - {type(e).__name__}: {e}")
@@ -131,5 +136,6 @@ def test_with_tree_sitter():
 
 
 if __name__ == "__main__":
-    success = test_with_tree_sitter()
+    # --write-sample also leaves the sample on disk for manual MCP runs
+    success = test_with_tree_sitter(write_sample="--write-sample" in sys.argv[1:])
     sys.exit(0 if success else 1)
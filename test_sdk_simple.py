@@ -5,13 +5,27 @@ Tests basic query functionality using project settings and working directory
 """
 
 import asyncio
+import logging
 from pathlib import Path
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, TextBlock
 
+logger = logging.getLogger(__name__)
 
-async def test_filesystem_access():
-    """Test basic filesystem access - read files and list directory"""
-    print("[TEST 1] Testing Claude Agent SDK with Local Filesystem\n")
+PROMPT_LS = "List the files in the current directory, then read CLAUDE.md and summarize what this project does in 2-3 sentences"
+PROMPT_MAIN = "Read main.py and tell me what it contains"
+PROMPT_AGENTS = "List the agent files in .claude/agents/ directory and tell me what each one does"
+
+# (header, query description, prompt) for each test, reported in this order
+TESTS = [
+    ("[TEST 1] Testing Claude Agent SDK with Local Filesystem", "List files and read CLAUDE.md", PROMPT_LS),
+    ("\n[TEST 2] Testing Reading main.py", "What is in main.py?", PROMPT_MAIN),
+    ("\n[TEST 3] Testing Agent Discovery", "What agents are available in .claude/agents/?", PROMPT_AGENTS),
+]
+
+
+async def run_test(header, description, prompt):
+    """Run one test query on its own SDK session and return its report text"""
+    lines = [f"{header}\n", f"Query: {description}\n"]
 
     # Configure SDK with working directory and project settings
     options = ClaudeAgentOptions(
@@ -20,88 +34,62 @@ async def test_filesystem_access():
     )
 
     async with ClaudeSDKClient(options=options) as client:
-        print("Query: List files and read CLAUDE.md\n")
-
-        await client.query("List the files in the current directory, then read CLAUDE.md and summarize what this project does in 2-3 sentences")
+        await client.query(prompt)
 
-        # Process response messages
         async for message in client.receive_response():
             if isinstance(message, AssistantMessage):
                 for block in message.content:
                     if isinstance(block, TextBlock):
-                        print("Response:")
-                        print("-" * 60)
-                        print(block.text)
-                        print("-" * 60)
-
-
-async def test_main_py():
-    """Test reading main.py file"""
-    print("\n[TEST 2] Testing Reading main.py\n")
-
-    options = ClaudeAgentOptions(
-        cwd=Path.cwd(),
-        setting_sources=["project"]
-    )
+                        lines += ["Response:", "-" * 60, block.text, "-" * 60]
 
-    async with ClaudeSDKClient(options=options) as client:
-        print("Query: What is in main.py?\n")
+    return "\n".join(lines)
 
-        await client.query("Read main.py and tell me what it contains")
 
-        async for message in client.receive_response():
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print("Response:")
-                        print("-" * 60)
-                        print(block.text)
-                        print("-" * 60)
+async def run_tests():
+    """
+    Run all test queries concurrently, one SDK session each
 
+    Reports are buffered per test and printed in TESTS order so concurrent
+    responses don't interleave.
 
-async def test_agents_discovery():
-    """Test if agents are discovered from .claude/agents/"""
-    print("\n[TEST 3] Testing Agent Discovery\n")
-
-    options = ClaudeAgentOptions(
-        cwd=Path.cwd(),
-        setting_sources=["project"]
+    Returns:
+        Number of tests that raised instead of completing
+    """
+    results = await asyncio.gather(
+        *(run_test(header, description, prompt) for header, description, prompt in TESTS),
+        return_exceptions=True,
     )
 
-    async with ClaudeSDKClient(options=options) as client:
-        print("Query: What agents are available in .claude/agents/?\n")
-
-        await client.query("List the agent files in .claude/agents/ directory and tell me what each one does")
-
-        async for message in client.receive_response():
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if isinstance(block, TextBlock):
-                        print("Response:")
-                        print("-" * 60)
-                        print(block.text)
-                        print("-" * 60)
+    failed = 0
+    for (header, _, _), result in zip(TESTS, results):
+        if isinstance(result, BaseException):
+            failed += 1
+            print(f"{header}\n")
+            logger.error("test failed", exc_info=result)
+        else:
+            print(result)
+    return failed
 
 
 async def main():
     """Main test runner"""
     try:
-        # Test 1: Basic filesystem access
-        await test_filesystem_access()
-
-        # Test 2: Read main.py
-        await test_main_py()
+        # Tests 1-3: filesystem access, main.py, agent discovery
+        failed = await run_tests()
+        if failed:
+            print(f"\n[ERROR] {failed} of {len(TESTS)} tests failed")
+        else:
+            print("\n[SUCCESS] All tests completed successfully!")
 
-        # Test 3: Agent discovery
-        await test_agents_discovery()
-
-        print("\n[SUCCESS] All tests completed successfully!")
-
-    except Exception as e:
-        print(f"\n[ERROR] Error occurred: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("SDK tests failed")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    logging.basicConfig(level=logging.INFO)
+    try:
+        import uvloop  # Optional faster event loop; not available on Windows
+    except ImportError:
+        uvloop = None
+    # Run outside the except block so logged tracebacks don't chain the ImportError
+    (uvloop.run if uvloop else asyncio.run)(main())
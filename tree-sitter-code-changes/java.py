@@ -20,11 +20,12 @@ TEMPLATES = {
         (import_declaration) @import
     """,
     "annotations": """
-        (marker_annotation
-            name: (identifier) @annotation.name) @annotation
-
-        (annotation
-            name: (identifier) @annotation.name) @annotation
+        [
+            (marker_annotation
+                name: (identifier) @annotation.name)
+            (annotation
+                name: (identifier) @annotation.name)
+        ] @annotation
     """,
     "enums": """
         (enum_declaration